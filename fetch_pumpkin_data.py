@@ -4,19 +4,72 @@ Script to fetch JSON data from wplace pumpkin tiles endpoint and serve filtered
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
+import orjson
 import os
 from datetime import datetime, timezone, timedelta
-from typing import Dict, Any, Set, List
-from flask import Flask, render_template_string, request, jsonify
+from typing import Dict, Any, Set, List, Optional, BinaryIO, Iterable
+from collections import namedtuple, OrderedDict
+from flask import Flask, Response, current_app, request, jsonify
+from flask.json.provider import DefaultJSONProvider
+import jinja2
+from flask_compress import Compress
+from markupsafe import escape
+from waitress import serve
 import threading
 import webbrowser
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import ciso8601
+except ImportError:  # Optional C parser, fall back to the stdlib
+    ciso8601 = None
+
+try:
+    import ijson
+except ImportError:  # Optional streaming parser for very large JSON payloads
+    ijson = None
+
+# JSON payloads at least this big are streamed with ijson instead of loaded whole
+_STREAM_THRESHOLD_BYTES = 1024 * 1024
+
+# Shared HTTP session so repeated fetches reuse pooled keep-alive connections,
+# sized so each of the 8 server threads can hold one
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=Retry(total=3, backoff_factor=0.3)))
+_SESSION.headers['Accept-Encoding'] = 'gzip'
+
+# Validators and parsed body of the last successful fetch, keyed by URL
+_fetch_cache: Dict[str, Dict[str, Any]] = {}
+
+# Last read_existing_ids result, keyed on the file's path, mtime (ns) and size
+_ids_cache: Dict[str, Any] = {}
+_ids_cache_lock = threading.Lock()
+
+
+def _drain_response(response: requests.Response) -> None:
+    """
+    Read the rest of a streamed response's body and discard it.
+    
+    requests closes the connection of a response whose body was not read to
+    the end, so draining it first lets the connection go back to the pool.
+    
+    Args:
+        response (requests.Response): The streamed response
+    """
+    _ = response.content
 
 
 def fetch_pumpkin_data(url: str = "https://wplace.samuelscheit.com/tiles/pumpkin.json") -> Dict[str, Any]:
     """
     Fetch JSON data from the pumpkin tiles endpoint.
     
+    Repeat fetches send the last response's ETag / Last-Modified, and a
+    304 Not Modified reply returns the previously parsed data unchanged.
+    Large responses are stream-parsed with ijson when it is installed.
+    
     Args:
         url (str): The URL to fetch data from
         
@@ -30,14 +83,44 @@ def fetch_pumpkin_data(url: str = "https://wplace.samuelscheit.com/tiles/pumpkin
     try:
         print(f"Fetching data from: {url}")
         
-        # Make the GET request
-        response = requests.get(url, timeout=30)
+        # Make a conditional GET if we have validators from a previous fetch
+        cached = _fetch_cache.get(url)
+        headers = {}
+        if cached:
+            if cached["etag"]:
+                headers["If-None-Match"] = cached["etag"]
+            if cached["last_modified"]:
+                headers["If-Modified-Since"] = cached["last_modified"]
         
-        # Raise an exception for bad status codes
-        response.raise_for_status()
+        # The with block releases the streamed response on every path
+        with _SESSION.get(url, timeout=30, headers=headers, stream=True) as response:
+            status_code = response.status_code
+            
+            if status_code == 304 and cached:
+                _drain_response(response)  # Always empty for a 304
+                print(f"Pumpkin data not modified, reusing {len(cached['data'])} cached pumpkins")
+                return cached["data"]
+            
+            # Raise an exception for bad status codes, after draining the (usually
+            # short) error body so the connection can be reused
+            if status_code >= 400:
+                _drain_response(response)
+                response.raise_for_status()
+            
+            # Parse JSON response, streaming it if it is large enough to be worth it.
+            # ijson.items builds the whole top-level value, object or not, as
+            # orjson.loads would
+            content_length = int(response.headers.get("Content-Length", 0))
+            if ijson is not None and content_length >= _STREAM_THRESHOLD_BYTES:
+                response.raw.decode_content = True
+                data = next(ijson.items(response.raw, "", use_float=True))
+            else:
+                data = orjson.loads(response.content)
         
-        # Parse JSON response
-        data = response.json()
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if etag or last_modified:
+            _fetch_cache[url] = {"etag": etag, "last_modified": last_modified, "data": data}
         
         print(f"Successfully fetched {len(data)} pumpkins")
         return data
@@ -59,38 +142,129 @@ def fetch_pumpkin_data(url: str = "https://wplace.samuelscheit.com/tiles/pumpkin
         raise
 
 
-def read_existing_ids(filename: str = "data.json") -> Set[int]:
+def _claimed_id(value: Any) -> str:
+    """
+    Convert a claimed pumpkin ID to the string form of the API's keys.
+    
+    Integral numbers such as 1 and 1.0 both become "1", so they still match
+    pumpkin 1 and count once, as when IDs were compared as numbers. Booleans
+    and all other values are kept as their str().
+    
+    Args:
+        value (Any): A claimed ID from data.json or the update form
+        
+    Returns:
+        str: The ID as a string
+    """
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+
+def _extract_existing_ids(data: Any) -> Optional[Set[str]]:
+    """
+    Extract pumpkin IDs from parsed data.json content.
+    
+    Args:
+        data (Any): The parsed JSON content
+        
+    Returns:
+        Optional[Set[str]]: Set of pumpkin IDs, or None if the format is not recognised
+    """
+    # Handle different possible formats
+    if isinstance(data, list):
+        return {_claimed_id(x) for x in data}
+    elif isinstance(data, dict):
+        # Check if it has a "claimed" key (our format)
+        if "claimed" in data and isinstance(data["claimed"], list):
+            return {_claimed_id(x) for x in data["claimed"]}
+        # Fallback to using dict keys as IDs
+        return set(filter(str.isdecimal, data.keys()))
+    return None
+
+
+def _stream_existing_ids(f: BinaryIO) -> Optional[Set[str]]:
+    """
+    Stream pumpkin IDs out of a data.json file without loading it whole.
+    
+    Accepts the same formats as _extract_existing_ids in a single pass.
+    
+    Args:
+        f (BinaryIO): The open data.json file
+        
+    Returns:
+        Optional[Set[str]]: Set of pumpkin IDs, or None if the format is not recognised
+    """
+    scalar_events = ('number', 'string', 'boolean', 'null')
+    top_level_event = None
+    list_ids = set()
+    claimed_ids = set()
+    key_ids = set()
+    has_claimed_list = False
+    
+    for prefix, event, value in ijson.parse(f, use_float=True):
+        if top_level_event is None:
+            top_level_event = event
+        if prefix == 'item' and event in scalar_events:
+            list_ids.add(_claimed_id(value))
+        elif prefix == 'claimed' and event == 'start_array':
+            has_claimed_list = True
+        elif prefix == 'claimed.item' and has_claimed_list and event in scalar_events:
+            claimed_ids.add(_claimed_id(value))
+        elif prefix == '' and event == 'map_key' and value.isdecimal():
+            key_ids.add(value)
+            
+    if top_level_event == 'start_array':
+        return list_ids
+    elif top_level_event == 'start_map':
+        return claimed_ids if has_claimed_list else key_ids
+    return None
+
+
+def read_existing_ids(filename: str = "data.json") -> Set[str]:
     """
     Read existing pumpkin IDs from data.json file.
     
+    IDs are returned as strings so they can be checked directly against the
+    string keys of the API data. The result is cached until the file's mtime
+    or size changes, so callers must not modify the returned set.
+    
     Args:
         filename (str): The filename to read from
         
     Returns:
-        Set[int]: Set of existing pumpkin IDs
+        Set[str]: Set of existing pumpkin IDs
     """
     try:
-        if not os.path.exists(filename):
+        # A single stat both checks the file exists and validates the cache
+        try:
+            st = os.stat(filename)
+        except FileNotFoundError:
             print(f"File {filename} not found, starting with empty list")
             return set()
             
-        with open(filename, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        # Skip the read and parse entirely if the file hasn't changed
+        cache_key = (filename, st.st_mtime_ns, st.st_size)
+        with _ids_cache_lock:
+            if _ids_cache.get('key') == cache_key:
+                return _ids_cache['ids']
             
-        # Handle different possible formats
-        if isinstance(data, list):
-            existing_ids = set(data)
-        elif isinstance(data, dict):
-            # Check if it has a "claimed" key (our format)
-            if "claimed" in data and isinstance(data["claimed"], list):
-                existing_ids = set(data["claimed"])
+        with open(filename, 'rb') as f:
+            if ijson is not None and st.st_size >= _STREAM_THRESHOLD_BYTES:
+                # Stream large files straight into the set instead of holding
+                # the raw bytes, the parsed list and the set all at once
+                existing_ids = _stream_existing_ids(f)
             else:
-                # Fallback to using dict keys as IDs
-                existing_ids = set(int(k) for k in data.keys() if k.isdigit())
-        else:
+                existing_ids = _extract_existing_ids(orjson.loads(f.read()))
+            
+        if existing_ids is None:
             print(f"Unexpected data format in {filename}")
             return set()
             
+        with _ids_cache_lock:
+            _ids_cache['key'] = cache_key
+            _ids_cache['ids'] = existing_ids
+            
         print(f"Found {len(existing_ids)} existing pumpkin IDs")
         return existing_ids
         
@@ -99,31 +273,84 @@ def read_existing_ids(filename: str = "data.json") -> Set[int]:
         return set()
 
 
-def filter_new_pumpkins(pumpkin_data: Dict[str, Any], existing_ids: Set[int]) -> Dict[str, Any]:
+def filter_new_pumpkins(pumpkin_data: Dict[str, Any], existing_ids: Set[str]) -> Dict[str, Any]:
     """
     Filter pumpkins to only include ones we don't already have.
     
     Args:
         pumpkin_data (Dict[str, Any]): All pumpkin data
-        existing_ids (Set[int]): Set of existing pumpkin IDs
+        existing_ids (Set[str]): Set of existing pumpkin IDs
         
     Returns:
-        Dict[str, Any]: Filtered pumpkin data
+        Dict[str, Any]: Filtered pumpkin data, ordered by pumpkin ID
     """
-    new_pumpkins = {}
+    # Set difference on the keys runs in C rather than a per-key Python loop
+    new_ids = pumpkin_data.keys() - existing_ids
+    new_pumpkins = {pid: pumpkin_data[pid] for pid in sorted(filter(str.isdecimal, new_ids), key=int)}
+    
+    print(f"Found {len(new_pumpkins)} new pumpkins")
+    return new_pumpkins
+
+
+def filter_new_pumpkins_mask(pumpkin_data: Dict[int, Any], claimed_mask: int) -> Dict[int, Any]:
+    """
+    Filter pumpkins to only include ones whose bit is clear in a claimed bitmask.
+    
+    Like filter_new_pumpkins, but each check is a shift and AND on the mask
+    instead of a set lookup, and the input order is kept rather than sorted.
+    
+    Args:
+        pumpkin_data (Dict[int, Any]): Pumpkin data keyed by integer pumpkin ID
+        claimed_mask (int): Bitmask of claimed pumpkin IDs, see _ids_to_mask
+        
+    Returns:
+        Dict[int, Any]: Filtered pumpkin data, in the order of pumpkin_data
+    """
+    new_pumpkins = {pid: info for pid, info in pumpkin_data.items() if not claimed_mask >> pid & 1}
     
-    for pumpkin_id, pumpkin_info in pumpkin_data.items():
-        try:
-            id_num = int(pumpkin_id)
-            if id_num not in existing_ids:
-                new_pumpkins[pumpkin_id] = pumpkin_info
-        except ValueError:
-            continue
-            
     print(f"Found {len(new_pumpkins)} new pumpkins")
     return new_pumpkins
 
 
+def parse_found_at(timestamp: str) -> datetime:
+    """
+    Parse a pumpkin's ISO 8601 foundAt timestamp.
+    
+    Uses ciso8601 when it is installed, which handles the trailing 'Z'
+    natively, otherwise falls back to datetime.fromisoformat.
+    
+    Args:
+        timestamp (str): The ISO 8601 timestamp, e.g. "2025-11-01T03:09:46.597Z"
+        
+    Returns:
+        datetime: The parsed timezone-aware datetime
+        
+    Raises:
+        ValueError: If the timestamp is not valid ISO 8601
+    """
+    if ciso8601 is not None:
+        return ciso8601.parse_datetime(timestamp)
+    return datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+
+
+def _found_before_hour(timestamp: Any, hour_prefix: str) -> bool:
+    """
+    Check from the raw foundAt string alone whether it is before an hour.
+    
+    UTC ISO 8601 timestamps ending in 'Z' sort lexicographically, so one below
+    the hour's '%Y-%m-%dT%H' prefix was found earlier. Anything else, such as a
+    timestamp with a different UTC offset, is left for the caller to parse.
+    
+    Args:
+        timestamp (Any): The pumpkin's foundAt value
+        hour_prefix (str): The UTC hour, formatted as '%Y-%m-%dT%H'
+        
+    Returns:
+        bool: True if the timestamp is known to be before the hour
+    """
+    return isinstance(timestamp, str) and timestamp.endswith('Z') and timestamp < hour_prefix
+
+
 def filter_recent_pumpkins(pumpkin_data: Dict[str, Any]) -> Dict[str, Any]:
     """
     Filter pumpkins to only include ones found within the current hour.
@@ -137,11 +364,22 @@ def filter_recent_pumpkins(pumpkin_data: Dict[str, Any]) -> Dict[str, Any]:
     now = datetime.now(timezone.utc)
     current_hour_start = now.replace(minute=0, second=0, microsecond=0)
     
+    # The API emits UTC 'Z' timestamps, which sort lexicographically, so
+    # anything below the hour prefix can be skipped without parsing
+    threshold_str = current_hour_start.strftime('%Y-%m-%dT%H')
+    
+    # Cut off on the raw strings in a single comprehension, keeping rows with
+    # no foundAt or another offset so the loop below still checks them
+    candidates = [
+        (pumpkin_id, pumpkin_info) for pumpkin_id, pumpkin_info in pumpkin_data.items()
+        if not _found_before_hour(pumpkin_info.get('foundAt'), threshold_str)
+    ]
+    
     recent_pumpkins = {}
     
-    for pumpkin_id, pumpkin_info in pumpkin_data.items():
+    for pumpkin_id, pumpkin_info in candidates:
         try:
-            found_at = datetime.fromisoformat(pumpkin_info['foundAt'].replace('Z', '+00:00'))
+            found_at = parse_found_at(pumpkin_info['foundAt'])
             if found_at >= current_hour_start:
                 recent_pumpkins[pumpkin_id] = pumpkin_info
         except (KeyError, ValueError) as e:
@@ -152,6 +390,164 @@ def filter_recent_pumpkins(pumpkin_data: Dict[str, Any]) -> Dict[str, Any]:
     return recent_pumpkins
 
 
+def filter_new_and_recent(pumpkin_data: Dict[str, Any], existing_ids: Set[str], cutoff_dt: datetime) -> Dict[str, Any]:
+    """
+    Filter pumpkins to ones we don't already have that were found since a cutoff.
+    
+    Gives the same result as filter_recent_pumpkins(filter_new_pumpkins(...))
+    for a cutoff at the start of the current hour, in a single pass without
+    building the intermediate dict.
+    
+    Args:
+        pumpkin_data (Dict[str, Any]): All pumpkin data
+        existing_ids (Set[str]): Set of existing pumpkin IDs
+        cutoff_dt (datetime): Timezone-aware datetime to keep pumpkins found at or after
+        
+    Returns:
+        Dict[str, Any]: Filtered pumpkin data, ordered by pumpkin ID
+    """
+    # No UTC 'Z' timestamp in the cutoff's hour sorts below its prefix, so
+    # those under it can be skipped without parsing
+    threshold_str = cutoff_dt.astimezone(timezone.utc).strftime('%Y-%m-%dT%H')
+    
+    new_and_recent = {}
+    
+    for pumpkin_id in sorted(filter(str.isdecimal, pumpkin_data.keys() - existing_ids), key=int):
+        pumpkin_info = pumpkin_data[pumpkin_id]
+        if _found_before_hour(pumpkin_info.get('foundAt'), threshold_str):
+            continue
+        try:
+            if parse_found_at(pumpkin_info['foundAt']) >= cutoff_dt:
+                new_and_recent[pumpkin_id] = pumpkin_info
+        except (KeyError, ValueError) as e:
+            print(f"Error parsing timestamp for pumpkin {pumpkin_id}: {e}")
+            continue
+            
+    print(f"Found {len(new_and_recent)} new pumpkins from the current hour")
+    return new_and_recent
+
+
+# Compact per-pumpkin record used by the web app in place of the API's dicts,
+# with found_at holding foundAt already parsed to a datetime and link the
+# pumpkin's wplace.live URL
+Pumpkin = namedtuple('Pumpkin', 'id foundAt lat lng tileX tileY offsetX offsetY found_at link')
+
+
+def to_pumpkin_records(pumpkin_data: Dict[str, Any]) -> Dict[str, Pumpkin]:
+    """
+    Convert the API's per-pumpkin dicts into Pumpkin records.
+    
+    Each foundAt timestamp is parsed, and each location link built, once here
+    so requests never have to. Fields missing from a pumpkin, and unparseable
+    timestamps, are set to None.
+    
+    Args:
+        pumpkin_data (Dict[str, Any]): Pumpkin data from the API
+        
+    Returns:
+        Dict[str, Pumpkin]: Pumpkin records keyed by pumpkin ID
+    """
+    records = {}
+    
+    for pumpkin_id, pumpkin_info in pumpkin_data.items():
+        found_at_str = pumpkin_info.get('foundAt')
+        try:
+            found_at = parse_found_at(found_at_str) if isinstance(found_at_str, str) else None
+        except ValueError as e:
+            print(f"Error parsing timestamp for pumpkin {pumpkin_id}: {e}")
+            found_at = None
+            
+        lat = pumpkin_info.get('lat')
+        lng = pumpkin_info.get('lng')
+        records[pumpkin_id] = Pumpkin(
+            pumpkin_id,
+            found_at_str,
+            lat,
+            lng,
+            pumpkin_info.get('tileX'),
+            pumpkin_info.get('tileY'),
+            pumpkin_info.get('offsetX'),
+            pumpkin_info.get('offsetY'),
+            found_at,
+            generate_pumpkin_link(lat, lng),
+        )
+        
+    return records
+
+
+def index_pumpkins_by_hour(pumpkin_data: Dict[str, Pumpkin]) -> Dict[str, Dict[int, Pumpkin]]:
+    """
+    Group pumpkins by the UTC hour they were found in.
+    
+    Keys are the UTC hour of the parsed found_at, formatted like the prefix
+    of an API timestamp, e.g. "2025-11-01T03", so the pumpkins from the
+    current hour are a single dict lookup. Each hour's pumpkins are keyed by
+    integer pumpkin ID and already ordered by it, non-numeric IDs are left out.
+    
+    Args:
+        pumpkin_data (Dict[str, Pumpkin]): Pumpkin records to group
+        
+    Returns:
+        Dict[str, Dict[int, Pumpkin]]: Pumpkin records keyed by hour prefix, then ID
+    """
+    by_hour = {}
+    
+    for pumpkin_id in sorted(filter(str.isdecimal, pumpkin_data), key=int):
+        pumpkin_info = pumpkin_data[pumpkin_id]
+        found_at = pumpkin_info.found_at
+        if found_at is not None:
+            hour_key = found_at.astimezone(timezone.utc).strftime('%Y-%m-%dT%H')
+            by_hour.setdefault(hour_key, {})[int(pumpkin_id)] = pumpkin_info
+            
+    return by_hour
+
+
+def _ids_to_mask(ids: Iterable[str], max_id: int) -> int:
+    """
+    Pack pumpkin IDs into an integer bitmask, with bit i set for pumpkin i.
+    
+    Only decimal IDs from 0 to max_id get a bit, so the mask stays small no
+    matter what IDs are pasted in. Others are skipped, they can't match any
+    pumpkin the mask is compared against.
+    
+    Args:
+        ids (Iterable[str]): Pumpkin IDs
+        max_id (int): Highest pumpkin ID to include
+        
+    Returns:
+        int: The bitmask
+    """
+    mask = 0
+    for pid in ids:
+        if pid.isdecimal():
+            i = int(pid)
+            if i <= max_id:
+                mask |= 1 << i
+    return mask
+
+
+def _mask_to_ids(mask: int) -> List[int]:
+    """
+    Unpack an integer bitmask into the pumpkin IDs of its set bits.
+    
+    Args:
+        mask (int): The bitmask
+        
+    Returns:
+        List[int]: The pumpkin IDs, in ascending order
+    """
+    ids = []
+    while mask:
+        low_bit = mask & -mask
+        ids.append(low_bit.bit_length() - 1)
+        mask ^= low_bit
+    return ids
+
+
+# wplace.live location link, built once per pumpkin by to_pumpkin_records
+_LINK_FMT = "https://wplace.live/?lat={lat}&lng={lng}&zoom=14"
+
+
 def generate_pumpkin_link(lat: float, lng: float) -> str:
     """
     Generate a wplace.live link for a pumpkin location.
@@ -163,25 +559,60 @@ def generate_pumpkin_link(lat: float, lng: float) -> str:
     Returns:
         str: The formatted link
     """
-    return f"https://wplace.live/?lat={lat}&lng={lng}&zoom=14"
+    return _LINK_FMT.format(lat=lat, lng=lng)
+
+
+# HTML for a single pumpkin result, filled in from the attributes of a Pumpkin
+# record passed as the only argument, so no dict is built per pumpkin. The
+# record's text fields must already be HTML-escaped, see render_pumpkin_items
+_ITEM_FMT = '''
+                    <div class="pumpkin-item">
+                        <div class="pumpkin-info">
+                            <div class="pumpkin-id">Pumpkin {0.id}</div>
+                            <div class="pumpkin-details">
+                                Found at: {0.foundAt}<br>
+                                Coordinates: {0.lat:.4f}, {0.lng:.4f}<br>
+                                Tile: {0.tileX}, {0.tileY} | Offset: {0.offsetX}, {0.offsetY}
+                            </div>
+                        </div>
+                        <a href="{0.link}" target="_blank" class="pumpkin-link">
+                            View Location
+                        </a>
+                    </div>
+                    '''
+
+_NO_PUMPKINS_HTML = '''
+                <div class="no-pumpkins">
+                    No new pumpkins found in the current hour. 🕐
+                </div>
+                '''
 
 
-def create_web_app(initial_pumpkin_data: Dict[str, Any]) -> Flask:
+def render_pumpkin_items(pumpkins: Dict[int, Pumpkin]) -> str:
     """
-    Create a Flask web application to display the filtered pumpkins.
+    Build the HTML for the list of pumpkin results.
+    
+    The API's fields are HTML-escaped, as the page template's autoescape
+    would, since the fragment goes into the page as a safe string.
     
     Args:
-        initial_pumpkin_data (Dict[str, Any]): The initial pumpkin data from API
+        pumpkins (Dict[int, Pumpkin]): The pumpkins to display
         
     Returns:
-        Flask: The Flask application
+        str: The HTML fragment for the results list
     """
-    app = Flask(__name__)
+    if not pumpkins:
+        return _NO_PUMPKINS_HTML
     
-    # Store the fetched pumpkin data globally for the app
-    app.pumpkin_data = initial_pumpkin_data
-    
-    html_template = """
+    format_item = _ITEM_FMT.format
+    return ''.join([
+        format_item(Pumpkin._make([escape(v) if isinstance(v, str) else v for v in info]))
+        for info in pumpkins.values()
+    ])
+
+
+# Dashboard page, compiled once at import so requests only render it
+_TEMPLATE_SRC = """
     <!DOCTYPE html>
     <html>
     <head>
@@ -487,29 +918,7 @@ def create_web_app(initial_pumpkin_data: Dict[str, Any]) -> Flask:
             </div>
             
             <div class="pumpkin-results">
-                <div id="pumpkinResults">
-                    {% if pumpkins %}
-                        {% for id, info in pumpkins.items() %}
-                        <div class="pumpkin-item">
-                            <div class="pumpkin-info">
-                                <div class="pumpkin-id">Pumpkin {{ id }}</div>
-                                <div class="pumpkin-details">
-                                    Found at: {{ info.foundAt }}<br>
-                                    Coordinates: {{ "%.4f"|format(info.lat) }}, {{ "%.4f"|format(info.lng) }}<br>
-                                    Tile: {{ info.tileX }}, {{ info.tileY }} | Offset: {{ info.offsetX }}, {{ info.offsetY }}
-                                </div>
-                            </div>
-                            <a href="{{ generate_link(info.lat, info.lng) }}" target="_blank" class="pumpkin-link">
-                                View Location
-                            </a>
-                        </div>
-                        {% endfor %}
-                    {% else %}
-                        <div class="no-pumpkins">
-                            No new pumpkins found in the current hour. 🕐
-                        </div>
-                    {% endif %}
-                </div>
+                <div id="pumpkinResults">{{ pumpkin_items_html|safe }}</div>
                 
                 <div class="refresh-info">
                     Last updated: <span id="lastUpdate">{{ current_time }}</span><br>
@@ -678,104 +1087,348 @@ def create_web_app(initial_pumpkin_data: Dict[str, Any]) -> Flask:
     </body>
     </html>
     """
+
+_ENV = jinja2.Environment(autoescape=True)
+_TEMPLATE = _ENV.from_string(_TEMPLATE_SRC)
+
+# Stands in for current_time when the page is rendered for the cache, so the
+# "Last updated" time can be filled in on every request
+_CURRENT_TIME_MARK = "@@CURRENT_TIME@@"
+
+# Placeholder page served until the initial fetch finishes, reloading itself.
+# Kept as UTF-8 bytes so it is sent without encoding it on each request
+_LOADING_HTML = """
+    <!DOCTYPE html>
+    <html>
+    <head>
+        <title>New Pumpkins Found This Hour</title>
+        <meta http-equiv="refresh" content="2">
+        <style>
+            body { 
+                font-family: Arial, sans-serif; 
+                margin: 20px; 
+                background-color: #f5f5f5;
+                text-align: center;
+                color: #666;
+            }
+        </style>
+    </head>
+    <body>
+        <h1>🎃 Loading pumpkin data...</h1>
+        <p>This page will refresh automatically.</p>
+    </body>
+    </html>
+    """.encode()
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider that serializes and parses with orjson."""
     
-    @app.route('/')
-    def index():
-        # Get initial filtered data
-        try:
-            existing_ids = read_existing_ids()
-            new_pumpkins = filter_new_pumpkins(app.pumpkin_data, existing_ids)
-            recent_pumpkins = filter_recent_pumpkins(new_pumpkins)
-        except:
-            recent_pumpkins = {}
-            existing_ids = set()
-            
-        # Calculate progress statistics
-        api_pumpkins = len(app.pumpkin_data)  # Pumpkins currently discovered/available in API
-        total_pumpkins = 100  # Total pumpkins that exist in the game
-        claimed_pumpkins = len(existing_ids)
-        pumpkins_left = total_pumpkins - claimed_pumpkins
-        api_progress_percent = round((claimed_pumpkins / api_pumpkins * 100), 1) if api_pumpkins > 0 else 0
-        real_progress_percent = round((claimed_pumpkins / total_pumpkins * 100), 1)
+    # orjson never sorts keys or pretty-prints, so report that to Flask too
+    sort_keys = False
+    compact = True
+    
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        # orjson takes no json.dumps options, so kwargs such as sort_keys are ignored
+        return orjson.dumps(obj, default=self.default).decode()
+    
+    def loads(self, s: Any, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+    
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        # Hand orjson's UTF-8 bytes straight to the response instead of
+        # decoding them to str for Flask to encode again. Arguments are read
+        # the way jsonify documents: one value, several as a list, or kwargs
+        if args and kwargs:
+            raise TypeError("app.json.response() takes either args or kwargs, not both")
+        obj = args[0] if len(args) == 1 else (args or kwargs or None)
+        return current_app.response_class(orjson.dumps(obj, default=self.default), mimetype=self.mimetype)
+
+
+# Everything the page and /update_pumpkins show that depends on the API data, the
+# claimed IDs and the current hour, shared by both routes
+UnclaimedSummary = namedtuple('UnclaimedSummary', [
+    'recent_pumpkins', 'pumpkin_items_html', 'missing_pumpkins_text', 'missing_from_api_count',
+    'available_unclaimed_count', 'unclaimed_links_text', 'recent_unclaimed_count',
+])
+
+# How many UnclaimedSummary results each app keeps, dropping the least recently used
+_SUMMARY_CACHE_SIZE = 8
+
+
+def _install_data(app: Flask, new_data: Dict[str, Any]) -> None:
+    """
+    Replace the app's pumpkin data and everything derived from it.
+    
+    The records, hour index, bitmask of API ids and API count are all built
+    here, once per fetch, so request handlers only read them. Passing the
+    dict that is already installed, as fetch_pumpkin_data returns on a 304,
+    does nothing, so data_version and the caches keyed on it are kept.
+    
+    Args:
+        app (Flask): The Flask application
+        new_data (Dict[str, Any]): The pumpkin data from API
+    """
+    with app.data_lock:
+        if new_data is app.source_data:
+            return
+    
+    records = to_pumpkin_records(new_data)
+    by_hour = index_pumpkins_by_hour(records)
+    api_mask = _ids_to_mask(records, max(map(int, filter(str.isdecimal, records)), default=0))
+    
+    with app.data_lock:
+        if new_data is app.source_data:
+            return  # Another request installed the same data meanwhile
+        app.source_data = new_data
+        app.pumpkin_data = records
+        app.by_hour = by_hour
+        app.api_mask = api_mask
+        app.api_pumpkins = len(records)
+        app.data_version += 1
+
+
+def create_web_app(initial_pumpkin_data: Optional[Dict[str, Any]] = None) -> Flask:
+    """
+    Create a Flask web application to display the filtered pumpkins.
+    
+    Args:
+        initial_pumpkin_data (Optional[Dict[str, Any]]): The initial pumpkin data from API,
+            or None to serve a loading page until _install_data is called
+        
+    Returns:
+        Flask: The Flask application
+    """
+    app = Flask(__name__)
+    
+    # Compress the page and the /update_pumpkins JSON, both of which grow with the
+    # results list; Brotli is preferred when the browser accepts it
+    app.config['COMPRESS_MIMETYPES'] = ['application/json', 'text/html']
+    app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+    app.config['COMPRESS_MIN_SIZE'] = 512
+    Compress(app)
+    
+    # Route jsonify and request.get_json through orjson
+    app.json = OrjsonProvider(app)
+    
+    # Guards replacing the pumpkin data attributes, since requests run on
+    # several server threads and must never see a half-updated set
+    app.data_lock = threading.Lock()
+    
+    # Bumped whenever app.pumpkin_data is replaced, so caches can key on it
+    app.data_version = 0
+    
+    # Store the fetched pumpkin data globally for the app as compact records,
+    # along with an hour index so requests only touch the current hour's pumpkins.
+    # pumpkin_data stays None while the initial fetch is still running
+    app.source_data = None
+    app.pumpkin_data = None
+    app.by_hour = None
+    app.api_mask = 0
+    app.api_pumpkins = 0
+    if initial_pumpkin_data is not None:
+        _install_data(app, initial_pumpkin_data)
+    
+    def snapshot_data():
+        """Read the pumpkin data, its derived values and data version together."""
+        with app.data_lock:
+            return app.pumpkin_data, app.by_hour, app.api_mask, app.api_pumpkins, app.data_version
+    
+    # /get_initial_data response body, keyed on data.json's mtime (ns) and size
+    app.data_json_cache = {}
+    app.data_json_cache_lock = threading.Lock()
+    
+    # Last rendered index page, reused until data.json, the hour or the API data changes
+    app.index_cache = {}
+    app.index_cache_lock = threading.Lock()
+    
+    def recent_unclaimed_pumpkins(by_hour: Dict[str, Dict[int, Pumpkin]], hour_key: str, claimed_mask: int) -> Dict[int, Pumpkin]:
+        """Get the pumpkins found in the given hour that haven't been claimed."""
+        # The hour buckets are pre-sorted by ID, so a single pass keeps the order
+        return filter_new_pumpkins_mask(by_hour.get(hour_key, {}), claimed_mask)
+    
+    # The "Missing from API" list depends only on the API data, so it is built
+    # once per data_version instead of on every request
+    app.missing_cache = {}
+    app.missing_cache_lock = threading.Lock()
+    
+    def missing_from_api_for(api_mask: int, data_version: int, total_pumpkins: int):
+        """Get the sorted ids missing from the API data and their comma-separated text."""
+        with app.missing_cache_lock:
+            if app.missing_cache.get('key') == data_version:
+                return app.missing_cache['value']
+        
+        # Bits 1..total_pumpkins, minus the ones the API has
+        all_mask = (1 << (total_pumpkins + 1)) - 2
+        missing_from_api = _mask_to_ids(all_mask & ~api_mask)
+        value = (missing_from_api, ", ".join(map(str, missing_from_api)))
+        
+        with app.missing_cache_lock:
+            app.missing_cache['key'] = data_version
+            app.missing_cache['value'] = value
         
-        # Generate missing pumpkins list
-        all_possible_ids = set(range(1, total_pumpkins + 1))
+        return value
+    
+    def claimed_mask_for(existing_ids: Set[str], api_mask: int, total_pumpkins: int) -> int:
+        """Get the claimed bitmask, covering only IDs that the game or the API can have."""
+        return _ids_to_mask(existing_ids, max(total_pumpkins, api_mask.bit_length() - 1))
+    
+    # Recently built summaries, keyed on (data_version, claimed_mask, hour_key),
+    # so repeat page loads and updates within the hour skip the work entirely
+    app.summary_cache = OrderedDict()
+    app.summary_cache_lock = threading.Lock()
+    
+    def unclaimed_summary(pumpkin_data: Dict[str, Pumpkin], by_hour: Dict[str, Dict[int, Pumpkin]], api_mask: int,
+                          data_version: int, claimed_mask: int, hour_key: str, total_pumpkins: int) -> UnclaimedSummary:
+        """Build, or reuse, the current hour's unclaimed pumpkins and the sidebar lists."""
+        key = (data_version, claimed_mask, hour_key)
+        with app.summary_cache_lock:
+            summary = app.summary_cache.get(key)
+            if summary is not None:
+                app.summary_cache.move_to_end(key)
+                return summary
         
-        # Handle case where API data is empty or unavailable
-        if app.pumpkin_data:
-            api_pumpkin_ids = set(int(pid) for pid in app.pumpkin_data.keys())
-            missing_from_api = sorted(all_possible_ids - api_pumpkin_ids)
-            available_unclaimed = sorted(api_pumpkin_ids - existing_ids)
+        # Filter the current hour's pumpkins to ones not yet claimed
+        recent_pumpkins = recent_unclaimed_pumpkins(by_hour, hour_key, claimed_mask)
+        
+        # Handle case where API data is empty or unavailable. The id lists come
+        # from bitmasks, which enumerate in order without sorting
+        if pumpkin_data:
+            missing_from_api, missing_from_api_text = missing_from_api_for(api_mask, data_version, total_pumpkins)
+            available_unclaimed = _mask_to_ids(api_mask & ~claimed_mask)
             
-            missing_pumpkins_text = "Missing from API:\n" + ", ".join(map(str, missing_from_api))
+            missing_pumpkins_text = "Missing from API:\n" + missing_from_api_text
             missing_pumpkins_text += "\n\nAvailable but unclaimed:\n" + ", ".join(map(str, available_unclaimed))
         else:
             # API failed or returned no data - show all unclaimed pumpkins
-            all_unclaimed = sorted(all_possible_ids - existing_ids)
+            all_unclaimed = _mask_to_ids(((1 << (total_pumpkins + 1)) - 2) & ~claimed_mask)
             missing_from_api = []
             available_unclaimed = []
             
             missing_pumpkins_text = "API unavailable - showing all unclaimed pumpkins:\n" + ", ".join(map(str, all_unclaimed))
         
-        missing_from_api_count = len(missing_from_api)
-        available_unclaimed_count = len(available_unclaimed)
-        
         # Generate unclaimed links text (filtered for current hour)
-        unclaimed_links_text = ""
-        recent_unclaimed_count = 0
-        
-        if app.pumpkin_data:
-            # API data available - show recent unclaimed with links
-            for pumpkin_id in available_unclaimed:
-                pumpkin_info = app.pumpkin_data.get(str(pumpkin_id))
-                if pumpkin_info:
-                    # Check if this pumpkin was found within the current hour
-                    try:
-                        found_at = datetime.fromisoformat(pumpkin_info['foundAt'].replace('Z', '+00:00'))
-                        now = datetime.now(timezone.utc)
-                        current_hour_start = now.replace(minute=0, second=0, microsecond=0)
-                        
-                        if found_at >= current_hour_start:
-                            link = generate_pumpkin_link(pumpkin_info['lat'], pumpkin_info['lng'])
-                            unclaimed_links_text += f"{pumpkin_id}: {link}\n"
-                            recent_unclaimed_count += 1
-                    except (KeyError, ValueError):
-                        continue
+        if pumpkin_data:
+            # API data available - show recent unclaimed with links. These are
+            # exactly the current hour's unclaimed pumpkins from the hour index,
+            # joined once rather than grown line by line
+            unclaimed_links_text = "".join([f"{pumpkin_id}: {pumpkin_info.link}\n" for pumpkin_id, pumpkin_info in recent_pumpkins.items()])
+            recent_unclaimed_count = len(recent_pumpkins)
         else:
             # API unavailable - show message about no recent links
             unclaimed_links_text = "API unavailable - cannot show recent links.\nRestart application when API is available."
             recent_unclaimed_count = 0
-            
-        return render_template_string(
-            html_template,
-            pumpkins=recent_pumpkins,
-            generate_link=generate_pumpkin_link,
-            current_time=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            pumpkin_count=len(recent_pumpkins),
+        
+        summary = UnclaimedSummary(
+            recent_pumpkins,
+            render_pumpkin_items(recent_pumpkins),
+            missing_pumpkins_text,
+            len(missing_from_api),
+            len(available_unclaimed),
+            unclaimed_links_text,
+            recent_unclaimed_count,
+        )
+        
+        with app.summary_cache_lock:
+            app.summary_cache[key] = summary
+            app.summary_cache.move_to_end(key)
+            while len(app.summary_cache) > _SUMMARY_CACHE_SIZE:
+                app.summary_cache.popitem(last=False)
+        
+        return summary
+    
+    def current_time_bytes():
+        """Get the page's "Last updated" time for this request as UTF-8 bytes."""
+        return datetime.now().strftime("%Y-%m-%d %H:%M:%S").encode()
+    
+    @app.route('/')
+    def index():
+        pumpkin_data, by_hour, api_mask, api_pumpkins, data_version = snapshot_data()
+        if pumpkin_data is None:
+            return Response(_LOADING_HTML, mimetype='text/html')
+        
+        # Serve the cached page if nothing it depends on has changed
+        current_hour_start = datetime.now(timezone.utc).replace(minute=0, second=0, microsecond=0)
+        try:
+            data_mtime_ns = os.stat("data.json").st_mtime_ns
+        except FileNotFoundError:
+            data_mtime_ns = 0
+        cache_key = (data_version, data_mtime_ns, current_hour_start)
+        
+        with app.index_cache_lock:
+            if app.index_cache.get('key') == cache_key:
+                return Response(current_time_bytes().join(app.index_cache['parts']), mimetype='text/html')
+        
+        # Get initial filtered data
+        try:
+            existing_ids = read_existing_ids()
+        except:
+            existing_ids = set()
+        
+        # Calculate progress statistics
+        total_pumpkins = 100  # Total pumpkins that exist in the game
+        claimed_pumpkins = len(existing_ids)
+        pumpkins_left = total_pumpkins - claimed_pumpkins
+        api_progress_percent = round((claimed_pumpkins / api_pumpkins * 100), 1) if api_pumpkins > 0 else 0
+        real_progress_percent = round((claimed_pumpkins / total_pumpkins * 100), 1)
+        
+        summary = unclaimed_summary(pumpkin_data, by_hour, api_mask, data_version, claimed_mask_for(existing_ids, api_mask, total_pumpkins),
+                                    current_hour_start.strftime('%Y-%m-%dT%H'), total_pumpkins)
+        
+        # Encode once here and split around the time, so cache hits only join
+        # ready-made UTF-8 bytes with the current time
+        parts = _TEMPLATE.render(
+            pumpkin_items_html=summary.pumpkin_items_html,
+            current_time=_CURRENT_TIME_MARK,
+            pumpkin_count=len(summary.recent_pumpkins),
             total_pumpkins=total_pumpkins,
             api_pumpkins=api_pumpkins,
             claimed_pumpkins=claimed_pumpkins,
             pumpkins_left=pumpkins_left,
-            new_this_hour=len(recent_pumpkins),
+            new_this_hour=len(summary.recent_pumpkins),
             api_progress_percent=api_progress_percent,
             real_progress_percent=real_progress_percent,
-            missing_pumpkins_text=missing_pumpkins_text,
-            missing_from_api_count=missing_from_api_count,
-            available_unclaimed_count=available_unclaimed_count,
-            unclaimed_links_text=unclaimed_links_text,
-            recent_unclaimed_count=recent_unclaimed_count
-        )
+            missing_pumpkins_text=summary.missing_pumpkins_text,
+            missing_from_api_count=summary.missing_from_api_count,
+            available_unclaimed_count=summary.available_unclaimed_count,
+            unclaimed_links_text=summary.unclaimed_links_text,
+            recent_unclaimed_count=summary.recent_unclaimed_count
+        ).encode().split(_CURRENT_TIME_MARK.encode())
+        
+        with app.index_cache_lock:
+            app.index_cache['key'] = cache_key
+            app.index_cache['parts'] = parts
+        
+        return Response(current_time_bytes().join(parts), mimetype='text/html')
     
     @app.route('/get_initial_data')
     def get_initial_data():
         """Get the current data.json content for the input field."""
         try:
-            if os.path.exists("data.json"):
-                with open("data.json", 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                return jsonify({"success": True, "data": data})
-            else:
+            try:
+                st = os.stat("data.json")
+            except FileNotFoundError:
                 return jsonify({"success": False, "error": "data.json not found"})
+            
+            # Only re-read the file when it has changed since the last request
+            cache_key = (st.st_mtime_ns, st.st_size)
+            with app.data_json_cache_lock:
+                if app.data_json_cache.get('key') == cache_key:
+                    return Response(app.data_json_cache['body'], mimetype='application/json')
+            
+            with open("data.json", 'rb') as f:
+                raw = f.read()
+            
+            # Parse only to validate, the file's own bytes are spliced into the
+            # response so it is never re-encoded
+            orjson.loads(raw)
+            body = b'{"success":true,"data":' + raw + b'}'
+            
+            with app.data_json_cache_lock:
+                app.data_json_cache['key'] = cache_key
+                app.data_json_cache['body'] = body
+            
+            return Response(body, mimetype='application/json')
         except Exception as e:
             return jsonify({"success": False, "error": str(e)})
     
@@ -791,123 +1444,54 @@ def create_web_app(initial_pumpkin_data: Dict[str, Any]) -> Flask:
             try:
                 print("Fetching fresh pumpkin data from API...")
                 fresh_pumpkin_data = fetch_pumpkin_data()
-                app.pumpkin_data = fresh_pumpkin_data  # Update the cached data
+                _install_data(app, fresh_pumpkin_data)  # Update the cached data
                 print(f"Updated with {len(fresh_pumpkin_data)} pumpkins from API")
             except Exception as e:
                 print(f"Warning: Could not fetch fresh data, using cached data. Error: {e}")
                 fresh_data_success = False
                 # Continue with cached data if API fetch fails
             
+            pumpkin_data, by_hour, api_mask, api_pumpkins, data_version = snapshot_data()
+            if pumpkin_data is None:
+                return jsonify({"success": False, "error": "Pumpkin data is still loading, please try again shortly"})
+            
             # Parse the input JSON
             try:
-                claimed_data = json.loads(input_data)
-            except json.JSONDecodeError as e:
+                claimed_data = orjson.loads(input_data)
+            except orjson.JSONDecodeError as e:
                 return jsonify({"success": False, "error": f"Invalid JSON: {str(e)}"})
             
             # Extract claimed IDs
             if isinstance(claimed_data, dict) and "claimed" in claimed_data:
-                existing_ids = set(claimed_data["claimed"])
+                existing_ids = {_claimed_id(x) for x in claimed_data["claimed"]}
             elif isinstance(claimed_data, list):
-                existing_ids = set(claimed_data)
+                existing_ids = {_claimed_id(x) for x in claimed_data}
             else:
                 return jsonify({"success": False, "error": "Expected format: {'claimed': [1,2,3...]} or [1,2,3...]"})
             
-            # Filter pumpkins
-            new_pumpkins = filter_new_pumpkins(app.pumpkin_data, existing_ids)
-            recent_pumpkins = filter_recent_pumpkins(new_pumpkins)
-            
-            # Generate HTML for the results
-            html_parts = []
-            if recent_pumpkins:
-                for pumpkin_id, info in recent_pumpkins.items():
-                    link = generate_pumpkin_link(info['lat'], info['lng'])
-                    html_parts.append(f'''
-                    <div class="pumpkin-item">
-                        <div class="pumpkin-info">
-                            <div class="pumpkin-id">Pumpkin {pumpkin_id}</div>
-                            <div class="pumpkin-details">
-                                Found at: {info['foundAt']}<br>
-                                Coordinates: {info['lat']:.4f}, {info['lng']:.4f}<br>
-                                Tile: {info['tileX']}, {info['tileY']} | Offset: {info['offsetX']}, {info['offsetY']}
-                            </div>
-                        </div>
-                        <a href="{link}" target="_blank" class="pumpkin-link">
-                            View Location
-                        </a>
-                    </div>
-                    ''')
-            else:
-                html_parts.append('''
-                <div class="no-pumpkins">
-                    No new pumpkins found in the current hour. 🕐
-                </div>
-                ''')
-            
             # Calculate progress statistics
-            api_pumpkins = len(app.pumpkin_data)  # Pumpkins currently discovered/available in API
             total_pumpkins = 100  # Total pumpkins that exist in the game
             claimed_pumpkins = len(existing_ids)
             pumpkins_left = total_pumpkins - claimed_pumpkins
             
-            # Generate missing pumpkins list
-            all_possible_ids = set(range(1, total_pumpkins + 1))
-            
-            # Handle case where API data is empty or unavailable
-            if app.pumpkin_data:
-                api_pumpkin_ids = set(int(pid) for pid in app.pumpkin_data.keys())
-                missing_from_api = sorted(all_possible_ids - api_pumpkin_ids)
-                available_unclaimed = sorted(api_pumpkin_ids - existing_ids)
-                
-                missing_pumpkins_text = "Missing from API:\n" + ", ".join(map(str, missing_from_api))
-                missing_pumpkins_text += "\n\nAvailable but unclaimed:\n" + ", ".join(map(str, available_unclaimed))
-            else:
-                # API failed or returned no data - show all unclaimed pumpkins
-                all_unclaimed = sorted(all_possible_ids - existing_ids)
-                missing_from_api = []
-                available_unclaimed = []
-                
-                missing_pumpkins_text = "API unavailable - showing all unclaimed pumpkins:\n" + ", ".join(map(str, all_unclaimed))
-            
-            # Generate unclaimed links text (filtered for current hour)
-            unclaimed_links_text = ""
-            recent_unclaimed_count = 0
-            
-            if app.pumpkin_data:
-                # API data available - show recent unclaimed with links
-                for pumpkin_id in available_unclaimed:
-                    pumpkin_info = app.pumpkin_data.get(str(pumpkin_id))
-                    if pumpkin_info:
-                        # Check if this pumpkin was found within the current hour
-                        try:
-                            found_at = datetime.fromisoformat(pumpkin_info['foundAt'].replace('Z', '+00:00'))
-                            now = datetime.now(timezone.utc)
-                            current_hour_start = now.replace(minute=0, second=0, microsecond=0)
-                            
-                            if found_at >= current_hour_start:
-                                link = generate_pumpkin_link(pumpkin_info['lat'], pumpkin_info['lng'])
-                                unclaimed_links_text += f"{pumpkin_id}: {link}\n"
-                                recent_unclaimed_count += 1
-                        except (KeyError, ValueError):
-                            continue
-            else:
-                # API unavailable - show message about no recent links
-                unclaimed_links_text = "API unavailable - cannot show recent links.\nRestart application when API is available."
-                recent_unclaimed_count = 0
+            current_hour_start = datetime.now(timezone.utc).replace(minute=0, second=0, microsecond=0)
+            summary = unclaimed_summary(pumpkin_data, by_hour, api_mask, data_version, claimed_mask_for(existing_ids, api_mask, total_pumpkins),
+                                        current_hour_start.strftime('%Y-%m-%dT%H'), total_pumpkins)
             
             return jsonify({
                 "success": True,
-                "html": ''.join(html_parts),
-                "count": len(recent_pumpkins),
+                "html": summary.pumpkin_items_html,
+                "count": len(summary.recent_pumpkins),
                 "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
                 "totalPumpkins": total_pumpkins,
                 "apiPumpkins": api_pumpkins,
                 "claimedPumpkins": claimed_pumpkins,
                 "pumpkinsLeft": pumpkins_left,
-                "missingPumpkinsText": missing_pumpkins_text,
-                "missingFromApiCount": len(missing_from_api),
-                "availableUnclaimedCount": len(available_unclaimed),
-                "unclaimedLinksText": unclaimed_links_text,
-                "recentUnclaimedCount": recent_unclaimed_count,
+                "missingPumpkinsText": summary.missing_pumpkins_text,
+                "missingFromApiCount": summary.missing_from_api_count,
+                "availableUnclaimedCount": summary.available_unclaimed_count,
+                "unclaimedLinksText": summary.unclaimed_links_text,
+                "recentUnclaimedCount": summary.recent_unclaimed_count,
                 "freshDataFetched": fresh_data_success
             })
             
@@ -917,17 +1501,33 @@ def create_web_app(initial_pumpkin_data: Dict[str, Any]) -> Flask:
     return app
 
 
-def save_data_to_file(data: Dict[str, Any], filename: str = "pumpkin_data.json") -> None:
+def save_data_to_file(data: Dict[str, Any], filename: str = "pumpkin_data.json", pretty: bool = False) -> None:
     """
     Save the fetched data to a JSON file.
     
+    The data is serialized in one go, written to a temporary file and then
+    moved into place, so readers never see a partially written file.
+    
     Args:
         data (Dict[str, Any]): The data to save
         filename (str): The filename to save to
+        pretty (bool): Indent the JSON for reading by hand, at roughly twice the size
     """
     try:
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        blob = memoryview(orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else 0))
+        tmp_filename = filename + '.tmp'
+        
+        fd = os.open(tmp_filename, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            # os.write may write less than asked for, so loop until done
+            while blob:
+                written = os.write(fd, blob)
+                blob = blob[written:]
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp_filename, filename)
+        
         print(f"Data saved to {filename}")
     except Exception as e:
         print(f"Error saving data to file: {e}")
@@ -939,31 +1539,44 @@ def open_browser():
     threading.Timer(1.5, lambda: webbrowser.open('http://127.0.0.1:5000')).start()
 
 
-def main():
-    """Main function to execute the script."""
+def load_initial_data(app: Flask) -> None:
+    """
+    Fetch the initial pumpkin data and install it into the web app.
+    
+    Runs on a background thread so the server can start listening straight
+    away, the page shows a loading state until the data is installed.
+    
+    Args:
+        app (Flask): The Flask application to install the data into
+    """
     try:
-        print("=== Pumpkin Tracker ===\n")
-        
-        # Step 1: Get the list of pumpkins
+        # Steps 1 and 2: Get the list of pumpkins and read existing IDs from
+        # data.json at the same time, the disk read overlaps the network fetch
         print("Step 1: Fetching pumpkin data...")
-        try:
-            pumpkin_data = fetch_pumpkin_data()
-        except Exception as e:
-            print(f"Warning: Failed to fetch initial pumpkin data from API: {e}")
-            print("Starting with empty pumpkin data - you can still track missing pumpkins 1-100")
-            pumpkin_data = {}
+        print("Step 2: Reading existing pumpkin IDs...")
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            pumpkin_data_future = executor.submit(fetch_pumpkin_data)
+            existing_ids_future = executor.submit(read_existing_ids)
+            
+            try:
+                pumpkin_data = pumpkin_data_future.result()
+            except Exception as e:
+                print(f"Warning: Failed to fetch initial pumpkin data from API: {e}")
+                print("Starting with empty pumpkin data - you can still track missing pumpkins 1-100")
+                pumpkin_data = {}
+            
+            existing_ids = existing_ids_future.result()
         
-        # Step 2: Read existing IDs from data.json
-        print("\nStep 2: Reading existing pumpkin IDs...")
-        existing_ids = read_existing_ids()
+        # Hand the data to the web app first, so the page stops loading as
+        # soon as possible
+        _install_data(app, pumpkin_data)
         
-        # Step 3: Filter to pumpkins we don't have
+        # Steps 3 and 4: Filter to pumpkins we don't have from the current hour,
+        # both checks in one pass over the data
         print("\nStep 3: Filtering to new pumpkins...")
-        new_pumpkins = filter_new_pumpkins(pumpkin_data, existing_ids)
-        
-        # Step 4: Filter to pumpkins from the current hour
-        print("\nStep 4: Filtering to recent pumpkins...")
-        recent_pumpkins = filter_recent_pumpkins(new_pumpkins)
+        print("Step 4: Filtering to recent pumpkins...")
+        current_hour_start = datetime.now(timezone.utc).replace(minute=0, second=0, microsecond=0)
+        recent_pumpkins = filter_new_and_recent(pumpkin_data, existing_ids, current_hour_start)
         
         # Step 5: Calculate and display pumpkins left to get
         api_pumpkins = len(pumpkin_data)  # Pumpkins currently discovered/available in API
@@ -988,10 +1601,22 @@ def main():
         # Save all fetched data for reference
         save_data_to_file(pumpkin_data, "all_pumpkins.json")
         save_data_to_file(recent_pumpkins, "recent_new_pumpkins.json")
+    except Exception as e:
+        print(f"Initial data load failed: {e}")
+        if app.pumpkin_data is None:
+            _install_data(app, {})
+
+
+def main():
+    """Main function to execute the script."""
+    try:
+        print("=== Pumpkin Tracker ===\n")
         
-        # Step 6: Serve website
-        print(f"\nStep 6: Starting web server...")
-        app = create_web_app(pumpkin_data)
+        # Start the web server right away and fetch the pumpkin data in the
+        # background, the page shows a loading state until it has arrived
+        print("Starting web server...")
+        app = create_web_app()
+        threading.Thread(target=load_initial_data, args=(app,), daemon=True).start()
         
         print("\n🎃 Pumpkin Tracker is running!")
         print("📍 Open your browser to: http://127.0.0.1:5000")
@@ -1000,8 +1625,13 @@ def main():
         # Open browser automatically
         open_browser()
         
-        # Run the Flask app
-        app.run(host='127.0.0.1', port=5000, debug=False)
+        # Run the Flask app on a multithreaded WSGI server, quietly since the
+        # address has already been printed above
+        serve(app, host='127.0.0.1', port=5000, threads=8, _quiet=True)
+        
+        # Waitress handles Ctrl+C itself and returns once it has shut down
+        print("\n\n🛑 Server stopped by user")
+        return 0
         
     except KeyboardInterrupt:
         print("\n\n🛑 Server stopped by user")
@@ -1,17 +1,28 @@
-import json
+import orjson
 
 # Path to your JSON file
 filename = "data.json"
 
 # Load the JSON data from the file
-with open(filename, "r") as f:
-    data = json.load(f)
+with open(filename, "rb") as f:
+    data = orjson.loads(f.read())
 
-# Get claimed numbers
-claimed = set(data.get("claimed", []))
+# Get claimed numbers as a bitmask, bit i set for number i
+claimed_mask = 0
+for i in data.get("claimed", []):
+    # Integral floats such as 5.0 claim their number too, booleans do not
+    if isinstance(i, float) and i.is_integer():
+        i = int(i)
+    if isinstance(i, int) and not isinstance(i, bool) and 0 <= i <= 100:
+        claimed_mask |= 1 << i
 
-# Compute missing numbers (0–100 inclusive)
-missing = sorted(set(range(101)) - claimed)
+# Compute missing numbers (0–100 inclusive), the set bits come out in order
+remaining = ((1 << 101) - 1) & ~claimed_mask
+missing = []
+while remaining:
+    low_bit = remaining & -remaining
+    missing.append(low_bit.bit_length() - 1)
+    remaining ^= low_bit
 
 # Print results cleanly
 print("Missing numbers (0–100):")